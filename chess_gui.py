@@ -36,7 +36,7 @@ DEFAULT_BOARD = (
 PIECES = ('p', 'n', 'b', 'r', 'q', 'k')
 
 SCALE_FACTOR = 5
-FRAME_RATE = 1
+FRAME_RATE = 30
 PIECE_SIZE = (7, 14)
 TILE_SIZE = 100
 TILE_DIMENSIONS = (TILE_SIZE, TILE_SIZE)
@@ -53,6 +53,10 @@ CONFIRM_TURN = False
 
 DISPLAY = pygame.display.set_mode([TILE_SIZE * 8 for _ in range(2)])
 SPRITE_SHEET = BlockSheet("spritesheet.png", SCALE_FACTOR, PIECE_SIZE)
+# older pygame builds only have VIDEOEXPOSE
+REDRAW_EVENTS = tuple(
+    getattr(pygame, name) for name in ('VIDEOEXPOSE', 'WINDOWEXPOSED', 'WINDOWRESTORED') if hasattr(pygame, name)
+)
 PIECE_SPRITES = {}
 for side in (1, -1):
     temp_sprites = SPRITE_SHEET.get_blocks(len(PIECES))
@@ -62,27 +66,63 @@ NUMBER_SPRITES = SPRITE_SHEET.get_custom_blocks((7, 7), 10, scale=NUMBER_SCALE_F
 def find_center(dimensions_1, dimensions_2, coordinates=(0, 0)):
     return [(coordinates[i] + (dimensions_1[i] / 2 - dimensions_2[i] / 2)) for i in range(2)]
 
-def draw_board(display, piece_sprites, number_sprites, board, piece_tile):
+def draw_background(display, number_sprites):
+    background = pygame.Surface(display.get_size()).convert()
     for y in BOARD_ITERATOR:
         for x in BOARD_ITERATOR:
-            tile_state = find_state((x, y), board)
-            coordinates = (x * TILE_SIZE, y * TILE_SIZE)
-            if (x, y) == piece_tile:
-                color = PLAYER_TILE_COLOR
-            else:
-                if (x - y) % 2 == 0:
-                    color = TILE_COLORS[-1]
-                else:
-                    color = TILE_COLORS[1]
-            pygame.draw.rect(display, color, (coordinates, TILE_DIMENSIONS))
-            if SHOW_NUMBERS:
-                display.blit(number_sprites[x], coordinates)
-                display.blit(number_sprites[y], (coordinates[0] + NUMBER_GAP, coordinates[1]))
-
-            if tile_state != EMPTY:
-                # print(x, y,  board[y][x])
-                sprite = piece_sprites[tile_state][find_type((x, y), board)]
-                display.blit(sprite, find_center(TILE_DIMENSIONS, sprite.get_size(), coordinates))
+            draw_tile(background, number_sprites, (x, y), find_tile_color((x, y)))
+    return background
+
+def find_tile_color(tile):
+    if (tile[0] - tile[1]) % 2 == 0:
+        return TILE_COLORS[-1]
+    return TILE_COLORS[1]
+
+def draw_tile(display, number_sprites, tile, color):
+    coordinates = (tile[0] * TILE_SIZE, tile[1] * TILE_SIZE)
+    pygame.draw.rect(display, color, (coordinates, TILE_DIMENSIONS))
+    if SHOW_NUMBERS:
+        display.blit(number_sprites[tile[0]], coordinates)
+        display.blit(number_sprites[tile[1]], (coordinates[0] + NUMBER_GAP, coordinates[1]))
+
+def find_sprite_offsets(piece_sprites):
+    return {
+        side: {piece: find_center(TILE_DIMENSIONS, sprite.get_size()) for piece, sprite in sprites.items()}
+        for side, sprites in piece_sprites.items()
+    }
+
+def find_changed_tiles(board, previous_board, piece_tile, previous_piece_tile):
+    if previous_board is None:
+        return [(x, y) for y in BOARD_ITERATOR for x in BOARD_ITERATOR]
+    tiles = []
+    for y in BOARD_ITERATOR:
+        if board[y] != previous_board[y]:
+            for x in BOARD_ITERATOR:
+                if board[y][x] != previous_board[y][x]:
+                    tiles.append((x, y))
+    if piece_tile != previous_piece_tile:
+        for tile in (piece_tile, previous_piece_tile):
+            if tile and tile not in tiles:
+                tiles.append(tile)
+    return tiles
+
+def draw_board(display, background, piece_sprites, sprite_offsets, number_sprites, board, piece_tile,
+               previous_board=None, previous_piece_tile=None):
+    dirty_rects = []
+    for tile in find_changed_tiles(board, previous_board, piece_tile, previous_piece_tile):
+        rect = pygame.Rect((tile[0] * TILE_SIZE, tile[1] * TILE_SIZE), TILE_DIMENSIONS)
+        if tile == piece_tile:
+            draw_tile(display, number_sprites, tile, PLAYER_TILE_COLOR)
+        else:
+            display.blit(background, rect, rect)
+
+        tile_state = find_state(tile, board)
+        if tile_state != EMPTY:
+            piece_type = find_type(tile, board)
+            offset = sprite_offsets[tile_state][piece_type]
+            display.blit(piece_sprites[tile_state][piece_type], (rect.x + offset[0], rect.y + offset[1]))
+        dirty_rects.append(rect)
+    return dirty_rects
 
 def run(board, side, turn, double_pawn):
     # current_time = time()
@@ -109,13 +149,26 @@ def main():
     turn = 1
     piece = None
     double_pawn = None
+    background = draw_background(DISPLAY, NUMBER_SPRITES)
+    sprite_offsets = find_sprite_offsets(PIECE_SPRITES)
+    previous_board = None
+    previous_piece = None
+    clock = pygame.time.Clock()
     while True:
-        draw_board(DISPLAY, PIECE_SPRITES, NUMBER_SPRITES, board, piece)
-        pygame.display.update()
+        clock.tick(FRAME_RATE)
+        dirty_rects = draw_board(DISPLAY, background, PIECE_SPRITES, sprite_offsets, NUMBER_SPRITES, board, piece,
+                                 previous_board, previous_piece)
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+        # board rows are replaced rather than mutated, so a shallow copy is enough to diff against
+        previous_board = tuple(board)
+        previous_piece = piece
         events = pygame.event.get()
         for event in events:
             if event.type == pygame.QUIT:
                 quit()
+            elif event.type in REDRAW_EVENTS:
+                previous_board = None
 
         if side:
             if side in COMPUTER_SIDES: